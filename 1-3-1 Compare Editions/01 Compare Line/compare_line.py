@@ -1,5 +1,10 @@
+import os
 import sys
 
+# 계측 모듈 (Common/instrument.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'Common'))
+import instrument
+
 def compare_files(file_a_path, file_b_path):
     # 연속 불일치 횟수를 저장할 변수
     consecutive_mismatches = 0
@@ -10,11 +15,15 @@ def compare_files(file_a_path, file_b_path):
         print(f"\n[알림] '{file_a_path}' 와 '{file_b_path}' 비교를 시작합니다...")
         
         # 두 파일을 UTF-8 인코딩으로 엽니다.
+        # (한 행씩 읽으면서 비교하므로 읽기 시간도 'match' 단계에 포함됨)
         with open(file_a_path, 'r', encoding='utf-8') as fa, \
-             open(file_b_path, 'r', encoding='utf-8') as fb:
+             open(file_b_path, 'r', encoding='utf-8') as fb, \
+             instrument.stage('match'):
             
             # zip을 사용하여 두 파일을 동시에 한 행씩 읽어옵니다.
             for line_no, (line_a, line_b) in enumerate(zip(fa, fb), 1):
+                instrument.count('lines')
+                instrument.progress('lines', line_no)
                 
                 # 개행 문자(\n) 및 앞뒤 공백 제거
                 clean_a = line_a.strip()
@@ -76,4 +85,5 @@ if __name__ == "__main__":
     if not file_name_A or not file_name_B:
         print("[오류] 파일 이름을 정확히 입력해야 합니다.")
     else:
-        compare_files(file_name_A, file_name_B)
\ No newline at end of file
+        with instrument.run('compare_line'):
+            compare_files(file_name_A, file_name_B)
\ No newline at end of file
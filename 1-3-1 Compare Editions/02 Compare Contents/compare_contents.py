@@ -2,6 +2,10 @@ import os
 import sys
 import difflib
 
+# 계측 모듈 (Common/instrument.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'Common'))
+import instrument
+
 # -------------------------------------------------------------------------
 # 설정 및 색상 상수 정의
 # -------------------------------------------------------------------------
@@ -84,17 +88,22 @@ def main():
             
             # enumerate 시작 번호를 (기존 작업량 + 1)로 설정
             for idx, (line_a_raw, line_b_raw) in enumerate(lines_to_process, start_line_index + 1):
-                
-                line_a = line_a_raw.rstrip('\n')
-                line_b = line_b_raw.rstrip('\n')
+                # 행 비교와 차이 표시까지만 계측 (아래의 사용자 입력 대기는 제외)
+                with instrument.stage('match'):
+                    instrument.count('lines')
+                    instrument.progress('lines', idx, total_lines)
+                    
+                    line_a = line_a_raw.rstrip('\n')
+                    line_b = line_b_raw.rstrip('\n')
 
-                # 2.1 완전 일치
-                if line_a == line_b:
-                    fc.write(line_a + '\n')
-                    continue
+                    # 2.1 완전 일치
+                    if line_a == line_b:
+                        fc.write(line_a + '\n')
+                        continue
 
-                # 2.2 불일치
-                diff_a, diff_b = get_highlighted_diff(line_a, line_b)
+                    # 2.2 불일치
+                    diff_a, diff_b = get_highlighted_diff(line_a, line_b)
+                    instrument.count('mismatches')
                 
                 print("-" * 50)
                 print(f"[{idx}/{total_lines}행 불일치]")
@@ -133,4 +142,5 @@ def main():
         print(f"\n오류 발생: {e}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    with instrument.run('compare_contents'):
+        main()
\ No newline at end of file
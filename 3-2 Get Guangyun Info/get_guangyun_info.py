@@ -1,8 +1,13 @@
 import pandas as pd
 import os
+import sys
 import json
 import string
 
+# 공통 모듈 (Common/instrument.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Common'))
+import instrument
+
 # 파일 상수 정의
 VARIANT_FILE = 'variants.json'
 CHOICE_FILE = 'choices.json'
@@ -25,6 +30,58 @@ def save_json(filename, data):
     except Exception as e:
         print(f"   [경고] {filename} 저장 실패: {e}")
 
+def find_matches(df_guangyun, search_char):
+    """광운 데이터에서 '字' 열이 검색 글자와 같은 행을 모두 찾습니다."""
+    return df_guangyun[df_guangyun['字'] == search_char]
+
+def pick_value(matches, char, target_col, choice_dict):
+    """
+    검색 결과에서 사용자에게 묻지 않고 정할 수 있는 값을 고릅니다.
+    (결과가 1개, 값이 1종류, 또는 저장된 선택이 후보에 있는 경우) 정할 수 없으면 None
+    """
+    # --- CASE 2: 검색 결과가 1개임 ---
+    if len(matches) == 1:
+        return str(matches.iloc[0][target_col])
+
+    # --- CASE 3: 검색 결과가 여러 개임 (중복 선택) ---
+    # 모든 값을 문자열로 변환하여 유니크 값 추출 (핵심 수정 사항)
+    unique_vals = matches[target_col].dropna().astype(str).unique()
+    
+    if len(unique_vals) == 1:
+        return unique_vals[0]
+
+    # 이미 저장된 선택이 있는지 확인
+    choice_key = f"{char}_{target_col}"
+    if choice_key in choice_dict:
+        saved_val = str(choice_dict[choice_key]) # 저장된 값도 문자열로 확실화
+        
+        # 저장된 값이 현재 후보군(문자열 리스트)에 존재하는지 확인
+        if saved_val in unique_vals:
+            # (선택사항) 자동 선택 로그를 보고 싶으면 주석 해제
+            # print(f"   [자동적용] '{char}' -> '{saved_val}'")
+            return saved_val
+
+    return None
+
+def resolve_value(df_guangyun, char, target_col, variant_dict, choice_dict):
+    """
+    한 글자에 대해 사용자 입력 없이 진행되는 부분 (이형자 처리 -> 광운 검색 -> 값 고르기)
+    반환값: (값, 검색어, 검색 결과). 값이 None이면 사용자 입력이 필요함
+            (검색 결과가 비어 있으면 대체 글자 입력, 아니면 중복 선택)
+    """
+    search_char = char
+
+    # (A) 이형자 처리 확인
+    if char in variant_dict:
+        search_char = variant_dict[char]
+    
+    # (B) 광운 데이터 검색
+    matches = find_matches(df_guangyun, search_char)
+    if matches.empty:
+        return None, search_char, matches
+
+    return pick_value(matches, char, target_col, choice_dict), search_char, matches
+
 def process_files():
     # 1. 파일 이름 입력 및 확인
     target_filename = input("작업할 파일명(예: input.txt)을 입력하세요: ").strip()
@@ -40,14 +97,15 @@ def process_files():
     try:
         # 2. 데이터 로딩
         print("파일 및 라이브러리를 읽어오는 중...")
-        df_target = pd.read_csv(target_filename, header=None, names=['Char'], encoding='utf-8', sep='\t')
-        
-        # 데이터 타입을 문자열로 통일하여 읽기 (dtype=str 옵션 추가) -> 숫자형 불일치 원천 차단
-        df_guangyun = pd.read_csv(guangyun_filename, sep='\t', encoding='utf-8', dtype=str)
-        
-        # 라이브러리 로드
-        variant_dict = load_json(VARIANT_FILE)
-        choice_dict = load_json(CHOICE_FILE)
+        with instrument.stage('load'):
+            df_target = pd.read_csv(target_filename, header=None, names=['Char'], encoding='utf-8', sep='\t')
+            
+            # 데이터 타입을 문자열로 통일하여 읽기 (dtype=str 옵션 추가) -> 숫자형 불일치 원천 차단
+            df_guangyun = pd.read_csv(guangyun_filename, sep='\t', encoding='utf-8', dtype=str)
+            
+            # 라이브러리 로드
+            variant_dict = load_json(VARIANT_FILE)
+            choice_dict = load_json(CHOICE_FILE)
         
         print(f"   -> 이형자 DB 로드됨 ({len(variant_dict)}개)")
         print(f"   -> 중복 선택 DB 로드됨 ({len(choice_dict)}개)")
@@ -66,15 +124,17 @@ def process_files():
 
         # 4. 한 줄씩 순회하며 처리
         for idx, row in df_target.iterrows():
-            char = str(row['Char']) # 입력 파일 글자도 문자열로 확실화
-            search_char = char
-
-            # (A) 이형자 처리 확인
-            if char in variant_dict:
-                search_char = variant_dict[char]
-            
-            # (B) 광운 데이터 검색
-            matches = df_guangyun[df_guangyun['字'] == search_char]
+            # 이형자 처리, 광운 검색, 자동으로 정할 수 있는 값 고르기 (사용자 입력 대기는 제외)
+            with instrument.stage('match'):
+                instrument.count('rows')
+                instrument.progress('rows', len(mapped_values) + 1, len(df_target))
+                char = str(row['Char']) # 입력 파일 글자도 문자열로 확실화
+                val, search_char, matches = resolve_value(df_guangyun, char, target_col, variant_dict, choice_dict)
+                instrument.count('lookups')
+
+            if val is not None:
+                mapped_values.append(val)
+                continue
             
             # --- CASE 1: 검색 결과가 없음 ---
             if matches.empty:
@@ -82,13 +142,18 @@ def process_files():
                 alt_input = input(f"   -> 대신 검색할 글자를 입력하세요 (없으면 Enter): ").strip()
                 
                 if alt_input:
-                    matches_retry = df_guangyun[df_guangyun['字'] == alt_input]
+                    matches_retry = find_matches(df_guangyun, alt_input)
                     if not matches_retry.empty:
                         variant_dict[char] = alt_input
                         save_json(VARIANT_FILE, variant_dict)
                         print(f"   [학습] '{char}' -> '{alt_input}' 관계 저장됨.")
                         matches = matches_retry
                         search_char = alt_input
+
+                        val = pick_value(matches, char, target_col, choice_dict)
+                        if val is not None:
+                            mapped_values.append(val)
+                            continue
                     else:
                         print(f"   [실패] '{alt_input}'도 데이터에 없습니다.")
                         mapped_values.append("")
@@ -98,34 +163,9 @@ def process_files():
                     mapped_values.append("")
                     continue
 
-            # --- CASE 2: 검색 결과가 1개임 ---
-            if len(matches) == 1:
-                val = str(matches.iloc[0][target_col])
-                mapped_values.append(val)
-                continue
-
-            # --- CASE 3: 검색 결과가 여러 개임 (중복 선택) ---
-            # 모든 값을 문자열로 변환하여 유니크 값 추출 (핵심 수정 사항)
-            unique_vals = matches[target_col].dropna().astype(str).unique()
-            
-            if len(unique_vals) == 1:
-                mapped_values.append(unique_vals[0])
-                continue
-
             # 선택이 필요한 경우
             choice_key = f"{char}_{target_col}"
             
-            # 이미 저장된 선택이 있는지 확인
-            if choice_key in choice_dict:
-                saved_val = str(choice_dict[choice_key]) # 저장된 값도 문자열로 확실화
-                
-                # 저장된 값이 현재 후보군(문자열 리스트)에 존재하는지 확인
-                if saved_val in unique_vals:
-                    mapped_values.append(saved_val)
-                    # (선택사항) 자동 선택 로그를 보고 싶으면 주석 해제
-                    # print(f"   [자동적용] '{char}' -> '{saved_val}'")
-                    continue
-            
             # 사용자에게 선택 요청
             print(f"\n[중복 발견] 글자 '{char}'에 대해 {len(matches)}개의 행이 있습니다.")
             print(f"   가져올 열: [{target_col}]")
@@ -168,7 +208,8 @@ def process_files():
         
         file_base, file_ext = os.path.splitext(target_filename)
         output_filename = f"{file_base}_{target_col}{file_ext}"
-        df_target.to_csv(output_filename, sep='\t', index=False, header=False, encoding='utf-8')
+        with instrument.stage('write'):
+            df_target.to_csv(output_filename, sep='\t', index=False, header=False, encoding='utf-8')
 
         print(f"\n---------------------------------------------------------")
         print(f"작업 완료! 결과 파일: {output_filename}")
@@ -178,4 +219,5 @@ def process_files():
         print(f"\n오류 발생: {e}")
 
 if __name__ == "__main__":
-    process_files()
\ No newline at end of file
+    with instrument.run('get_guangyun_info'):
+        process_files()
\ No newline at end of file
@@ -0,0 +1,250 @@
+import pandas as pd
+import os
+import sys
+
+from cit_pair import load_data, extract_citations, count_pair_orders, analyze_pair_correlations
+
+# 공통 모듈 (Common/instrument.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Common'))
+import instrument
+
+def build_tournament(stats, threshold=5):
+    """
+    count_pair_orders()의 쌍별 횟수로 가중 토너먼트를 만드는 함수
+    (cit_pair와 같이 공기 횟수가 threshold 미만인 쌍은 제외)
+    반환값: {A: {B: A가 B보다 먼저 나온 횟수}}
+    """
+    weights = {}
+
+    for (item_a, item_b), data in stats.items():
+        if data['total'] < threshold:
+            continue
+        weights.setdefault(item_a, {})[item_b] = data['key0_first']
+        weights.setdefault(item_b, {})[item_a] = data['key1_first']
+
+    return weights
+
+def initial_order(weights):
+    """순(Net) 우세 점수가 높은 순서로 초기 순서를 정하는 함수"""
+    scores = {}
+    for a, targets in weights.items():
+        scores[a] = scores.get(a, 0)
+        for b, w in targets.items():
+            scores[a] += w
+            scores[b] = scores.get(b, 0) - w
+
+    # 점수가 같으면 이름순으로 고정하여 결과 재현성 확보
+    order = sorted(weights, key=lambda c: (-scores[c], c))
+    return order, scores
+
+def order_cost(order, weights):
+    """계산된 순서에 어긋나는 증거(뒤에 놓인 쪽이 먼저 나온 횟수)의 총합"""
+    position = {c: i for i, c in enumerate(order)}
+    cost = 0.0
+    for a, targets in weights.items():
+        for b, w in targets.items():
+            if position[a] > position[b]:
+                cost += w
+    return cost
+
+def improve_order(order, weights, max_passes=50):
+    """
+    한 항목을 빼서 비용이 가장 작은 위치에 다시 넣는 국소 탐색(Insertion local search)
+    이웃(함께 등장한 항목)의 위치만 훑으므로 항목이 수천 개여도 빠르게 동작함
+    """
+    # 양방향 이웃 목록: neighbors[v] = [(u, w(u->v), w(v->u)), ...]
+    neighbors = {c: {} for c in weights}
+    for a, targets in weights.items():
+        for b, w in targets.items():
+            neighbors[b].setdefault(a, [0.0, 0.0])[0] += w # a가 b보다 먼저
+            neighbors[a].setdefault(b, [0.0, 0.0])[1] += w # a(=v)가 b(=u)보다 먼저
+
+    order = list(order)
+    position = {c: i for i, c in enumerate(order)}
+
+    for _ in range(max_passes):
+        moved = False
+
+        for v in list(order):
+            if not neighbors[v]:
+                continue
+
+            cur = position[v]
+            # v를 뺀 뒤의 위치로 이웃을 정렬 (v보다 뒤에 있던 항목은 한 칸 당겨짐)
+            nbrs = []
+            for u, (w_uv, w_vu) in neighbors[v].items():
+                p = position[u]
+                nbrs.append((p - 1 if p > cur else p, w_uv, w_vu))
+            nbrs.sort()
+
+            # slot 0 (모든 이웃보다 앞): u가 먼저 나온 증거가 모두 위반됨
+            cost = sum(w_uv for _, w_uv, _ in nbrs)
+            best_cost, best_slot = None, None
+            cur_cost = None
+
+            # slot은 '앞에 놓인 항목 수'. 이웃 사이 구간 안에서는 비용이 같으므로
+            # 각 구간에서 현재 위치에 가장 가까운 slot만 후보로 본다
+            for k in range(len(nbrs) + 1):
+                lo = nbrs[k - 1][0] + 1 if k > 0 else 0
+                hi = nbrs[k][0] if k < len(nbrs) else len(order) - 1
+                slot = min(max(cur, lo), hi)
+
+                if lo <= cur <= hi:
+                    cur_cost = cost
+                if best_cost is None or cost < best_cost - 1e-9:
+                    best_cost, best_slot = cost, slot
+
+                if k < len(nbrs):
+                    _, w_uv, w_vu = nbrs[k]
+                    # 이웃 u를 v 앞으로 넘기면: u가 먼저인 증거는 충족, v가 먼저인 증거는 위반
+                    cost += w_vu - w_uv
+
+            if best_cost < cur_cost - 1e-9 and best_slot != cur:
+                order.pop(cur)
+                order.insert(best_slot, v)
+                lo, hi = min(cur, best_slot), max(cur, best_slot)
+                for i in range(lo, hi + 1):
+                    position[order[i]] = i
+                moved = True
+
+        if not moved:
+            break
+
+    return order
+
+def solve_order(stats, threshold=5, max_passes=50):
+    """
+    쌍별 횟수로부터 전체 인용 순서(합의 순서)를 계산하는 함수
+    net_score는 초기 순서를 정할 때 쓴 순 우세 점수(먼저 나온 횟수 - 나중에 나온 횟수)로,
+    국소 탐색 후의 최종 순위(rank)와 꼭 일치하지는 않음
+    """
+    weights = build_tournament(stats, threshold)
+    if not weights:
+        return pd.DataFrame(columns=['rank', 'citation', 'net_score']), weights
+
+    order, scores = initial_order(weights)
+    order = improve_order(order, weights, max_passes)
+
+    ranking = pd.DataFrame({
+        'rank': range(1, len(order) + 1),
+        'citation': order,
+        'net_score': [scores[c] for c in order]
+    })
+    return ranking, weights
+
+def find_violations(order, pair_df):
+    """
+    계산된 순서와 어긋나는 쌍을 찾는 함수
+    (다수 순서가 A -> B인데 순서상 B가 A보다 앞에 놓인 경우)
+    """
+    position = {c: i + 1 for i, c in enumerate(order)}
+    results = []
+
+    for row in pair_df.itertuples(index=False):
+        # 양방향 행 중 다수 순서(probability > 0.5) 쪽만 검사
+        if row.probability <= 0.5:
+            continue
+        if position[row.cit1] > position[row.cit2]:
+            results.append({
+                'cit1': row.cit1,
+                'cit2': row.cit2,
+                'probability': row.probability,
+                'quantity': row.quantity,
+                'rank1': position[row.cit1],
+                'rank2': position[row.cit2]
+            })
+
+    return pd.DataFrame(results, columns=['cit1', 'cit2', 'probability', 'quantity', 'rank1', 'rank2'])
+
+def run_ordering(sequences, threshold=5, book=None):
+    """시퀀스 목록으로 쌍 분석 -> 순서 계산 -> 위반 쌍 추출까지 수행하는 함수"""
+    with instrument.stage('match'):
+        stats = count_pair_orders(sequences)
+        pair_df = analyze_pair_correlations(sequences, threshold, stats)
+    if pair_df.empty:
+        return None, None
+
+    with instrument.stage('solve'):
+        ranking, weights = solve_order(stats, threshold)
+        violations = find_violations(ranking['citation'].tolist(), pair_df)
+        instrument.count('citations', len(ranking))
+
+    total = sum(w for targets in weights.values() for w in targets.values())
+    cost = order_cost(ranking['citation'].tolist(), weights)
+    agreement = round(1 - cost / total, 4) if total else 1.0
+    print(f"   -> 항목 {len(ranking)}개, 위반 쌍 {len(violations)}개, 일치율 {agreement}")
+
+    if book is not None:
+        ranking.insert(0, 'book', book)
+        violations.insert(0, 'book', book)
+
+    return ranking, violations
+
+# === 메인 실행 로직 ===
+def main():
+    # 1. 데이터 로드
+    df = load_data()
+
+    # 2. 시퀀스 추출
+    with instrument.stage('parse'):
+        df['sequence'] = df['content'].apply(extract_citations)
+        instrument.count('rows', len(df))
+
+    # 3. 기준값 및 서명별 분석 여부 입력
+    while True:
+        try:
+            th_input = input("🔢 최소 공기(Co-occurrence) 횟수를 입력하세요 (기본값 5): ").strip()
+            if not th_input:
+                threshold = 5
+            else:
+                threshold = int(th_input)
+            break
+        except ValueError:
+            print("⚠️ 정수를 입력해주세요.")
+
+    per_book = input("📚 서명(book)별로 순서를 따로 계산할까요? (y/N): ").strip().lower() == 'y'
+
+    # 4. 순서 계산
+    rankings, violations = [], []
+
+    if per_book:
+        for book, group in df.groupby('book', sort=False):
+            print(f"\n📖 {book}")
+            ranking, violation = run_ordering(group['sequence'].tolist(), threshold, book)
+            if ranking is not None:
+                rankings.append(ranking)
+                violations.append(violation)
+    else:
+        ranking, violation = run_ordering(df['sequence'].tolist(), threshold)
+        if ranking is not None:
+            rankings.append(ranking)
+            violations.append(violation)
+
+    if rankings:
+        result_df = pd.concat(rankings, ignore_index=True)
+        violation_df = pd.concat(violations, ignore_index=True)
+
+        # 위반 쌍은 quantity 많은 순 -> probability 높은 순
+        violation_df = violation_df.sort_values(by=['quantity', 'probability'], ascending=[False, False])
+
+        print(f"\n✅ 순서 계산 완료! 총 {len(result_df)}개 항목, 위반 쌍 {len(violation_df)}개")
+        print("=== 상위 10개 순서 ===")
+        print(result_df.head(10).to_string(index=False))
+
+        # 5. 저장
+        save_filename = "cit_order_ranking.txt"
+        violation_filename = "cit_order_violations.txt"
+        try:
+            with instrument.stage('write'):
+                result_df.to_csv(save_filename, sep='\t', index=False, encoding='utf-8-sig')
+                violation_df.to_csv(violation_filename, sep='\t', index=False, encoding='utf-8-sig')
+            print(f"\n💾 결과가 '{save_filename}', '{violation_filename}' 파일로 저장되었습니다.")
+        except Exception as e:
+            print(f"❌ 저장 실패: {e}")
+
+    else:
+        print("\n⚠️ 설정한 기준(Threshold)을 만족하는 쌍이 하나도 없습니다.")
+
+if __name__ == "__main__":
+    with instrument.run('cit_order'):
+        main()
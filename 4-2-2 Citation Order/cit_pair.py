@@ -1,8 +1,13 @@
 import pandas as pd
 import re
 import os
+import sys
 import itertools
 
+# 공통 모듈 (Common/instrument.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Common'))
+import instrument
+
 def load_data():
     """사용자 입력으로 파일을 불러오는 함수"""
     while True:
@@ -14,13 +19,17 @@ def load_data():
             
         try:
             ext = os.path.splitext(filename)[1].lower()
-            if ext == '.csv':
-                df = pd.read_csv(filename, encoding='utf-8-sig')
-            elif ext in ['.tsv', '.txt']:
-                df = pd.read_csv(filename, sep='\t', encoding='utf-8-sig')
-            elif ext in ['.xls', '.xlsx']:
-                df = pd.read_excel(filename)
-            else:
+            # 파일명 입력 시간은 빼고 실제 읽기만 'load' 단계로 측정
+            with instrument.stage('load'):
+                if ext == '.csv':
+                    df = pd.read_csv(filename, encoding='utf-8-sig')
+                elif ext in ['.tsv', '.txt']:
+                    df = pd.read_csv(filename, sep='\t', encoding='utf-8-sig')
+                elif ext in ['.xls', '.xlsx']:
+                    df = pd.read_excel(filename)
+                else:
+                    df = None
+            if df is None:
                 print("❌ 지원하지 않는 파일 형식입니다.\n")
                 continue
             
@@ -40,18 +49,18 @@ def extract_citations(text):
         return []
     return re.findall(pattern, str(text))
 
-def analyze_pair_correlations(sequences, threshold=5):
+def count_pair_orders(sequences):
     """
-    모든 쌍(Pair)에 대해 (빈도, 확률)을 계산하여 리스트로 반환
+    모든 쌍(Pair)에 대해 공기 횟수와 먼저 나온 횟수(반올림 전 원래 값)를 세는 함수
+    반환값: {(A, B): {'total': 총공기횟수, 'key0_first': A가 먼저 나온 횟수, 'key1_first': B가 먼저 나온 횟수}}
     """
-    # 1. 데이터를 저장할 딕셔너리
     # key: (A, B) 튜플 (순서 구분 없음, 정렬해서 저장)
-    # value: {'total': 총공기횟수, 'A_first': A가 먼저 나온 횟수, 'B_first': B가 먼저 나온 횟수}
     stats = {}
 
-    print("🔄 쌍(Pair) 분석 및 확률 계산 중...")
+    instrument.count('sequences', len(sequences))
 
-    for seq in sequences:
+    for n, seq in enumerate(sequences, 1):
+        instrument.progress('sequences', n, len(sequences))
         if len(seq) < 2:
             continue
         
@@ -83,6 +92,19 @@ def analyze_pair_correlations(sequences, threshold=5):
                 else:
                     stats[key]['key1_first'] += 1 # key[1] (first)가 먼저 나옴 (즉 second가 먼저)
 
+    return stats
+
+def analyze_pair_correlations(sequences, threshold=5, stats=None):
+    """
+    모든 쌍(Pair)에 대해 (빈도, 확률)을 계산하여 리스트로 반환
+    stats: count_pair_orders()의 결과를 이미 가지고 있으면 넘겨서 다시 세지 않음
+    """
+    print("🔄 쌍(Pair) 분석 및 확률 계산 중...")
+
+    # 1. 쌍별 횟수 집계
+    if stats is None:
+        stats = count_pair_orders(sequences)
+
     # 2. 결과 리스트 생성 (Threshold 적용)
     results = []
     
@@ -114,12 +136,14 @@ def analyze_pair_correlations(sequences, threshold=5):
     return pd.DataFrame(results)
 
 # === 메인 실행 로직 ===
-if __name__ == "__main__":
+def main():
     # 1. 데이터 로드
     df = load_data()
     
     # 2. 시퀀스 추출
-    df['sequence'] = df['content'].apply(extract_citations)
+    with instrument.stage('parse'):
+        df['sequence'] = df['content'].apply(extract_citations)
+        instrument.count('rows', len(df))
     
     # 3. 기준값 입력
     while True:
@@ -135,7 +159,8 @@ if __name__ == "__main__":
 
     # 4. 분석 수행
     all_sequences = df['sequence'].tolist()
-    result_df = analyze_pair_correlations(all_sequences, threshold)
+    with instrument.stage('match'):
+        result_df = analyze_pair_correlations(all_sequences, threshold)
     
     if not result_df.empty:
         # 5. 정렬 (quantity 많은 순 -> probability 높은 순)
@@ -148,10 +173,15 @@ if __name__ == "__main__":
         # 6. 저장
         save_filename = "cit_pair_analysis.txt"
         try:
-            result_df.to_csv(save_filename, sep='\t', index=False, encoding='utf-8-sig')
+            with instrument.stage('write'):
+                result_df.to_csv(save_filename, sep='\t', index=False, encoding='utf-8-sig')
             print(f"\n💾 결과가 '{save_filename}' 파일로 저장되었습니다.")
         except Exception as e:
             print(f"❌ 저장 실패: {e}")
             
     else:
-        print("\n⚠️ 설정한 기준(Threshold)을 만족하는 쌍이 하나도 없습니다.")
\ No newline at end of file
+        print("\n⚠️ 설정한 기준(Threshold)을 만족하는 쌍이 하나도 없습니다.")
+
+if __name__ == "__main__":
+    with instrument.run('cit_pair'):
+        main()
\ No newline at end of file
@@ -0,0 +1,277 @@
+import os
+import io
+import sys
+import time
+import argparse
+import platform
+import tempfile
+import datetime
+import tracemalloc
+import subprocess
+import contextlib
+
+import pandas as pd
+
+import make_corpus
+
+# 각 도구 폴더를 경로에 추가하여 핫 패스 함수를 직접 불러옴
+ROOT_DIR = make_corpus.ROOT_DIR
+for tool_dir in ['Character Count',
+                 os.path.join('1-3-1 Compare Editions', '01 Compare Line'),
+                 os.path.join('1-3-1 Compare Editions', '02 Compare Contents'),
+                 '3-2 Get Guangyun Info',
+                 '4-2-2 Citation Order']:
+    sys.path.insert(0, os.path.join(ROOT_DIR, tool_dir))
+
+import character_count
+import compare_line
+import compare_contents
+import get_guangyun_info
+import cit_pair
+import cit_order
+import shiwen_text
+
+# 결과를 누적 저장할 TSV 파일 이름 (실행한 폴더에 생성)
+RESULT_FILE = "benchmark_results.tsv"
+RESULT_COLUMNS = ['timestamp', 'version', 'python', 'benchmark', 'scale', 'items',
+                  'wall_time', 'throughput', 'peak_mem_kb', 'status']
+
+# 도구가 오류를 화면에 출력할 때 붙이는 표시 (출력에 있으면 실패로 기록)
+ERROR_MARK = "[오류]"
+
+def git_version():
+    """현재 저장소의 커밋 해시 (측정 버전 구분용)"""
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or 'unknown'
+    except Exception:
+        return 'unknown'
+
+# -------------------------------------------------------------------------
+# 벤치마크 정의: prepare(scale, work_dir) -> (run 함수, 처리 항목 수, setup 함수, check 함수)
+# setup은 매 측정 직전에 호출됨 (캐시 초기화 등)
+# check(run의 반환값)는 결과가 잘못되었으면 오류 메시지, 정상이면 None을 반환
+# -------------------------------------------------------------------------
+def check_dataframe(result):
+    """결과 DataFrame이 비어 있으면 실패"""
+    if result is None or result.empty:
+        return "결과가 비어 있음"
+    return None
+
+def prepare_count_characters(scale, work_dir, cache=None):
+    """
+    cache=None  : 캐시 없이 파싱부터 (메모리/디스크 캐시 모두 비움)
+    cache='disk': 디스크 캐시에서 불러오기 (새 프로세스에서 같은 파일을 다시 여는 경우)
+    cache='memory': 메모리 캐시에서 바로 반환 (한 실행 안에서 같은 파일을 다시 여는 경우)
+    """
+    paths = make_corpus.write_corpus(work_dir, scale)
+    filename = paths['edition_a']
+    with open(filename, 'r', encoding='utf-8') as f:
+        items = sum(1 for _ in f)
+
+    # 사용자의 캐시 폴더를 건드리지 않도록 임시 폴더 안에 디스크 캐시를 둠
+    shiwen_text.CACHE_DIR = os.path.join(work_dir, 'cache')
+
+    def setup():
+        shiwen_text.clear_cache(disk=cache is None)
+        if cache is not None:
+            # 한 번 읽어 캐시를 만들어 둠
+            character_count.count_characters(filename)
+        if cache == 'disk':
+            shiwen_text.clear_cache()
+
+    def check(result):
+        if result is None or result[0] is None:
+            return "글자 수를 세지 못함"
+        return None
+
+    return (lambda: character_count.count_characters(filename)), items, setup, check
+
+def prepare_count_characters_disk(scale, work_dir):
+    return prepare_count_characters(scale, work_dir, cache='disk')
+
+def prepare_count_characters_cached(scale, work_dir):
+    return prepare_count_characters(scale, work_dir, cache='memory')
+
+def prepare_compare_files(scale, work_dir):
+    paths = make_corpus.write_corpus(work_dir, scale)
+    file_a, file_b = paths['edition_a'], paths['edition_b']
+    with open(file_a, 'r', encoding='utf-8') as f:
+        items = sum(1 for _ in f)
+
+    def run():
+        try:
+            compare_line.compare_files(file_a, file_b)
+        except SystemExit:
+            # 연속 3회 불일치 시 sys.exit() 호출됨
+            pass
+
+    # 파일을 찾지 못하는 등의 실패는 출력의 [오류] 표시로 확인
+    return run, items, None, None
+
+def prepare_highlighted_diff(scale, work_dir):
+    _, _, line_pairs = make_corpus.make_editions(scale)
+
+    def run():
+        for line_a, line_b in line_pairs:
+            compare_contents.get_highlighted_diff(line_a, line_b)
+
+    return run, len(line_pairs), None, None
+
+def prepare_pair_correlations(scale, work_dir):
+    rows = make_corpus.make_citations(scale)
+    sequences = [cit_pair.extract_citations(content) for _, content in rows]
+    return (lambda: cit_pair.analyze_pair_correlations(sequences, 5)), len(sequences), None, check_dataframe
+
+def prepare_solve_order(scale, work_dir):
+    rows = make_corpus.make_citations(scale)
+    sequences = [cit_pair.extract_citations(content) for _, content in rows]
+    stats = cit_pair.count_pair_orders(sequences)
+    return (lambda: cit_order.solve_order(stats, 5)[0]), len(stats), None, check_dataframe
+
+def prepare_guangyun_lookup(scale, work_dir):
+    """
+    get_guangyun_info.process_files()의 행 처리 중 사용자 입력이 없는 부분만 측정
+    (이형자 처리 -> 광운 검색 -> 값 고르기. 대체 글자 입력, 중복 선택 입력 및 저장은 제외)
+    """
+    # get_guangyun_info.process_files()와 같은 방식으로 광운 데이터를 읽음
+    df_guangyun = pd.read_csv(make_corpus.SAMPLE_GUANGYUN, sep='\t', encoding='utf-8', dtype=str)
+    targets = make_corpus.make_guangyun_targets(scale)
+    target_col = '上字'
+
+    def run():
+        return [get_guangyun_info.resolve_value(df_guangyun, char, target_col, {}, {})[0] for char in targets]
+
+    def check(result):
+        if all(val is None for val in result):
+            return "값을 하나도 찾지 못함"
+        return None
+
+    return run, len(targets), None, check
+
+BENCHMARKS = {
+    'count_characters': prepare_count_characters,
+    'count_characters_disk': prepare_count_characters_disk,
+    'count_characters_cached': prepare_count_characters_cached,
+    'compare_files': prepare_compare_files,
+    'get_highlighted_diff': prepare_highlighted_diff,
+    'analyze_pair_correlations': prepare_pair_correlations,
+    'solve_order': prepare_solve_order,
+    'guangyun_lookup': prepare_guangyun_lookup,
+}
+
+def run_checked(run, check=None):
+    """
+    run을 한 번 실행하고 (소요 시간, 오류 메시지)를 반환
+    출력에 [오류] 표시가 있거나 check가 실패를 알리면 오류 메시지를 채움
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        start = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - start
+
+    for line in output.getvalue().splitlines():
+        if ERROR_MARK in line:
+            return elapsed, line.strip()
+    if check:
+        return elapsed, check(result)
+    return elapsed, None
+
+def measure(run, setup=None, check=None, repeat=3):
+    """
+    실행 시간(최솟값)과 최대 메모리 사용량을 측정
+    tracemalloc은 실행을 느리게 하므로 시간 측정과 별도로 한 번 더 실행함
+    반환값: (시간, 메모리 KB, 오류 메시지). 실패하면 그 자리에서 멈추고 시간/메모리는 None
+    """
+    best = None
+    for _ in range(repeat):
+        if setup:
+            with contextlib.redirect_stdout(io.StringIO()):
+                setup()
+        elapsed, error = run_checked(run, check)
+        if error:
+            return None, None, error
+        best = elapsed if best is None else min(best, elapsed)
+
+    if setup:
+        with contextlib.redirect_stdout(io.StringIO()):
+            setup()
+    tracemalloc.start()
+    try:
+        _, error = run_checked(run, check)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    if error:
+        return None, None, error
+
+    return best, peak // 1024, None
+
+def write_results(rows, filename=RESULT_FILE):
+    """결과를 TSV 파일에 추가합니다. 파일이 없으면 헤더도 작성"""
+    write_header = not os.path.exists(filename)
+    if not write_header:
+        with open(filename, 'r', encoding='utf-8') as f_in:
+            if f_in.readline().rstrip('\n').split('\t') != RESULT_COLUMNS:
+                print(f"⚠️ '{filename}'의 열 구성이 현재와 다릅니다. 새 파일 이름을 --output으로 지정하세요.")
+    try:
+        with open(filename, 'a', encoding='utf-8') as f_out:
+            if write_header:
+                f_out.write("\t".join(RESULT_COLUMNS) + "\n")
+            for row in rows:
+                f_out.write("\t".join(str(row[c]) for c in RESULT_COLUMNS) + "\n")
+        print(f"\n💾 결과를 '{filename}'에 추가했습니다.")
+    except IOError as e:
+        print(f"❌ 결과 파일('{filename}') 저장 중 오류 발생: {e}")
+
+def main():
+    parser = argparse.ArgumentParser(description="각 도구의 핫 패스 함수 성능을 측정합니다.")
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10], help="샘플 대비 배율 목록 (기본값 1 10)")
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help="측정할 벤치마크만 지정")
+    parser.add_argument('--repeat', type=int, default=3, help="반복 횟수 (최솟값 사용, 기본값 3)")
+    parser.add_argument('--output', default=RESULT_FILE, help="결과 TSV 파일")
+    args = parser.parse_args()
+
+    names = args.only or list(BENCHMARKS)
+    timestamp = datetime.datetime.now().isoformat(timespec='seconds')
+    version = git_version()
+    rows = []
+
+    print(f"=== 벤치마크 (버전 {version}, Python {platform.python_version()}) ===")
+    print(f"{'benchmark':<28}{'scale':>6}{'items':>10}{'wall_time':>12}{'items/s':>14}{'peak_kb':>12}")
+
+    for scale in args.scales:
+        with tempfile.TemporaryDirectory() as work_dir:
+            for name in names:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    run, items, setup, check = BENCHMARKS[name](scale, work_dir)
+                wall_time, peak_kb, error = measure(run, setup, check, args.repeat)
+
+                # 실패한 측정은 시간/처리량을 비워 두고 status에 오류 내용을 남김
+                if error:
+                    print(f"{name:<28}{scale:>6}{items:>10}  ❌ 실패: {error}")
+                    wall_time, throughput, peak_kb, status = '', '', '', f"failed: {error}"
+                else:
+                    throughput = round(items / wall_time, 1) if wall_time > 0 else 0
+                    print(f"{name:<28}{scale:>6}{items:>10}{wall_time:>12.4f}{throughput:>14}{peak_kb:>12}")
+                    wall_time, status = round(wall_time, 6), 'ok'
+
+                rows.append({
+                    'timestamp': timestamp,
+                    'version': version,
+                    'python': platform.python_version(),
+                    'benchmark': name,
+                    'scale': scale,
+                    'items': items,
+                    'wall_time': wall_time,
+                    'throughput': throughput,
+                    'peak_mem_kb': peak_kb,
+                    'status': status
+                })
+
+    write_results(rows, args.output)
+
+if __name__ == "__main__":
+    main()
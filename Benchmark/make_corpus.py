@@ -0,0 +1,123 @@
+import os
+import random
+import argparse
+
+# 저장소에 포함된 샘플 파일 경로
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+SAMPLE_SBCK = os.path.join(ROOT_DIR, '1-3-1 Compare Editions', '01 Compare Line', 'sample_sbck.txt')
+SAMPLE_WYG = os.path.join(ROOT_DIR, '1-3-1 Compare Editions', '01 Compare Line', 'sample_wyg.txt')
+SAMPLE_CITATION = os.path.join(ROOT_DIR, '4-2-2 Citation Order', 'input.txt')
+SAMPLE_GUANGYUN = os.path.join(ROOT_DIR, '3-2 Get Guangyun Info', 'guangyun.txt')
+
+# 광운 검색 대상 글자 수 (배율 1 기준)
+# 글자 하나당 광운 전체(약 2만 5천 행)를 훑어 2~3ms가 걸리므로 배율 100에서도 수십 초 안에 끝나도록 작게 잡음
+GUANGYUN_TARGET_SIZE = 100
+
+def read_lines(filepath):
+    """샘플 파일을 행 단위로 읽어옵니다. (BOM, 개행 문자 제외)"""
+    with open(filepath, 'r', encoding='utf-8-sig') as f:
+        return [line.rstrip('\n') for line in f]
+
+def write_lines(filepath, lines, bom=False):
+    """행 목록을 UTF-8 파일로 저장합니다."""
+    with open(filepath, 'w', encoding='utf-8-sig' if bom else 'utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+
+def mark_up_line(line, rng):
+    """
+    교감본 형식의 행으로 변환 (표제어 + (주석))
+    글자 수 세기에서 처리하는 태그, ¶, /, &KR 엔티티를 일정 비율로 섞음
+    """
+    head, _, note = line.partition('\t')
+    if rng.random() < 0.1:
+        head = f"<pb:KR1g{rng.randint(1, 999):04d}>" + head
+    if rng.random() < 0.1:
+        note = note[:len(note) // 2] + f"&KR{rng.randint(1, 9999)};" + note[len(note) // 2:]
+    if rng.random() < 0.05:
+        head = head + "¶"
+    if rng.random() < 0.05:
+        note = note.replace('反', '反/', 1)
+    return f"{head}({note})" if note else head
+
+def perturb_line(line, rng, rate=0.2):
+    """첫 글자와 마지막 글자는 두고 가운데 글자 하나를 바꿔 다른 판본의 행을 흉내냄"""
+    if len(line) < 3 or rng.random() >= rate:
+        return line
+    i = rng.randrange(1, len(line) - 1)
+    return line[:i] + rng.choice('之也者云反音同') + line[i + 1:]
+
+def make_editions(scale, seed=0):
+    """
+    판본 비교/글자 수 세기용 행 목록 생성
+    반환값: (교감본 A 행 목록, 교감본 B 행 목록, 실제 두 판본의 행 쌍 목록)
+    """
+    rng = random.Random(seed)
+    sbck = [line for line in read_lines(SAMPLE_SBCK) if line.strip()]
+    wyg = [line for line in read_lines(SAMPLE_WYG) if line.strip()]
+
+    edition_a = []
+    for k in range(scale):
+        edition_a.append(f"# 第{k + 1}卷")
+        edition_a.extend(mark_up_line(line, rng) for line in sbck)
+    edition_b = [perturb_line(line, rng) for line in edition_a]
+
+    # 실제 두 판본의 같은 번호 행을 짝지어 차이 하이라이트용 쌍으로 사용
+    line_pairs = list(zip(sbck, wyg)) * scale
+
+    return edition_a, edition_b, line_pairs
+
+def make_citations(scale, seed=0):
+    """
+    인용 순서 분석용 (book, content) 행 목록 생성
+    배율만큼 복제하되 복제본은 일부 행의 인용 순서를 섞어 확률 분포를 흔듦
+    """
+    rng = random.Random(seed)
+    rows = [line.split('\t', 1) for line in read_lines(SAMPLE_CITATION)[1:] if '\t' in line]
+
+    result = []
+    for k in range(scale):
+        for book, content in rows:
+            if k > 0 and rng.random() < 0.2:
+                parts = content.replace('《', '\t《').replace('〚', '\t〚').split('\t')
+                parts = [p for p in parts if p]
+                rng.shuffle(parts)
+                content = "".join(parts)
+            result.append((book, content))
+    return result
+
+def make_guangyun_targets(scale, seed=0):
+    """광운 검색 대상 글자 목록 생성 (광운 글자 + 샘플 본문 글자)"""
+    rng = random.Random(seed)
+    chars = [line.split('\t')[1] for line in read_lines(SAMPLE_GUANGYUN)[1:] if line.count('\t') >= 1]
+    chars += [ch for line in read_lines(SAMPLE_SBCK) for ch in line if '一' <= ch <= '鿿']
+    return [rng.choice(chars) for _ in range(GUANGYUN_TARGET_SIZE * scale)]
+
+def write_corpus(out_dir, scale, seed=0):
+    """배율에 맞는 합성 코퍼스를 폴더에 저장하고 파일 경로를 반환합니다."""
+    os.makedirs(out_dir, exist_ok=True)
+    edition_a, edition_b, _ = make_editions(scale, seed)
+
+    paths = {
+        'edition_a': os.path.join(out_dir, f"edition_a_x{scale}.txt"),
+        'edition_b': os.path.join(out_dir, f"edition_b_x{scale}.txt"),
+        'citation': os.path.join(out_dir, f"citation_x{scale}.txt"),
+        'guangyun_target': os.path.join(out_dir, f"guangyun_target_x{scale}.txt"),
+    }
+
+    # 교감본은 BOM 없이 저장 (BOM이 붙으면 첫 행의 '#'가 머리행으로 인식되지 않음)
+    write_lines(paths['edition_a'], edition_a)
+    write_lines(paths['edition_b'], edition_b)
+    write_lines(paths['citation'], ['book\tcontent'] + [f"{b}\t{c}" for b, c in make_citations(scale, seed)], bom=True)
+    write_lines(paths['guangyun_target'], make_guangyun_targets(scale, seed))
+
+    return paths
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="저장소 샘플로 배율을 키운 합성 코퍼스를 생성합니다.")
+    parser.add_argument('--scale', type=int, default=10, help="샘플 대비 배율 (기본값 10, 최대 100 권장)")
+    parser.add_argument('--seed', type=int, default=0, help="난수 시드 (기본값 0)")
+    parser.add_argument('--out', default='corpus', help="저장할 폴더 (기본값 corpus)")
+    args = parser.parse_args()
+
+    for name, path in write_corpus(args.out, args.scale, args.seed).items():
+        print(f"{name}: {path}")
@@ -1,5 +1,11 @@
 import re
 import os
+import sys
+
+# 공통 텍스트 로더 (Common/shiwen_text.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Common'))
+from shiwen_text import load_corpus, main_text, comment_text, LINE_TEXT, LINE_BLANK
+import instrument
 
 # 결과를 저장할 TSV 파일 이름
 RESULT_FILE = "character_counts.tsv"
@@ -20,14 +26,15 @@ def count_characters(filename):
     comment_text_count = 0
 
     try:
-        with open(filename, 'r', encoding='utf-8') as f_in:
-            all_lines = f_in.readlines()
+        # 태그, ¶, /, &KR\d+; 엔티티, ( ) 주석 처리는 공통 로더가 담당 (규칙 2~4, 6, 7)
+        corpus = load_corpus(filename)
+        kinds = corpus['kinds']
 
         # 규칙 8: 내용이 있는 마지막 행은 세지 않습니다.
         # 뒤에서부터 순회하며 내용이 있는 첫 번째 줄(즉, 파일의 마지막 내용 줄)의 인덱스를 찾습니다.
         last_content_line_index = -1
-        for i in range(len(all_lines) - 1, -1, -1):
-            if all_lines[i].strip():
+        for i in range(len(kinds) - 1, -1, -1):
+            if kinds[i] != LINE_BLANK:
                 last_content_line_index = i
                 break
 
@@ -35,41 +42,25 @@ def count_characters(filename):
             print(f"'{filename}' 파일이 비어있거나 내용이 없습니다.")
             return None, None, None # 처리할 내용이 없음
 
-        # 마지막 내용 줄을 *제외*하고 처리하기 위해 슬라이싱합니다.
-        # all_lines[:last_content_line_index] 는 0부터 last_content_line_index - 1 까지의 모든 줄을 포함합니다.
-        for line in all_lines[:last_content_line_index]:
-            line = line.strip()
-
-            # 규칙 2: #로 시작하는 행은 무시
-            if line.startswith('#'):
-                continue
-
-            # 규칙 3: <[^>]+> (HTML 태그 등) 무시
-            line = re.sub(r'<[^>]+>', '', line)
-
-            # 규칙 4: ¶와 /는 무시
-            line = line.replace('¶', '').replace('/', '')
-
-            # 규칙 6: &KR\d+; 문자열은 1개 글자로 간주
-            # '임시' 문자(예: '_')로 대체하여 나중에 공백 제거 후 1글자로 카운트되도록 함
-            line = re.sub(r'&KR\d+;', '_', line)
+        # 마지막 내용 줄을 *제외*하고 처리합니다.
+        with instrument.stage('count'):
+            for i in range(last_content_line_index):
+                instrument.progress('lines', i + 1, last_content_line_index)
 
-            # 규칙 7: (와 ) 사이는 주석, 나머지는 경문
-            # re.findall로 모든 주석 괄호 안의 내용을 추출합니다.
-            comment_parts = re.findall(r'\((.*?)\)', line)
-            comment_text = " ".join(comment_parts) # 모든 주석 내용을 하나로 합침
+                # 규칙 2: #로 시작하는 행은 무시 (빈 행도 건너뜀)
+                if kinds[i] != LINE_TEXT:
+                    continue
 
-            # re.sub로 괄호와 그 안의 내용을 모두 제거하여 경문만 남깁니다.
-            main_text = re.sub(r'\(.*?\)', '', line)
+                # 규칙 5: 공백 문자는 세지 않음
+                # 경문과 주석 각각에서 모든 공백(스페이스, 탭 등)을 제거
+                cleaned_main = re.sub(r'\s', '', main_text(corpus, i))
+                cleaned_comment = re.sub(r'\s', '', comment_text(corpus, i))
 
-            # 규칙 5: 공백 문자는 세지 않음
-            # 경문과 주석 각각에서 모든 공백(스페이스, 탭 등)을 제거
-            cleaned_main = re.sub(r'\s', '', main_text)
-            cleaned_comment = re.sub(r'\s', '', comment_text)
+                # 글자 수 누적
+                main_text_count += len(cleaned_main)
+                comment_text_count += len(cleaned_comment)
 
-            # 글자 수 누적
-            main_text_count += len(cleaned_main)
-            comment_text_count += len(cleaned_comment)
+            instrument.count('lines', last_content_line_index)
 
         total_count = main_text_count + comment_text_count
         return main_text_count, comment_text_count, total_count
@@ -116,7 +107,7 @@ def main():
 
             # 규칙 9: 결과를 TSV 파일에 추가 (append)
             try:
-                with open(RESULT_FILE, 'a', encoding='utf-8') as f_out:
+                with instrument.stage('write'), open(RESULT_FILE, 'a', encoding='utf-8') as f_out:
                     f_out.write(f"{filename}\t{main_count}\t{comment_count}\t{total_count}\n")
                 print(f"결과를 '{RESULT_FILE}'에 성공적으로 저장했습니다.\n")
             except IOError as e:
@@ -126,4 +117,5 @@ def main():
             print("다음 파일 이름을 입력하세요.\n")
 
 if __name__ == "__main__":
-    main()
+    with instrument.run('character_count'):
+        main()
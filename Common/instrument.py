@@ -0,0 +1,229 @@
+import os
+import sys
+import json
+import time
+import contextlib
+
+try:
+    import resource
+except ImportError: # Windows
+    resource = None
+
+# 환경 변수로 켜는 계측 기능 (코드 수정 없이 사용)
+#   SHIWEN_PROFILE=1          : 실행이 끝나면 단계별 시간/처리량 요약(JSON)을 출력
+#   SHIWEN_PROFILE_OUT=파일명  : 요약을 화면 대신 파일에 한 줄씩 추가
+#   SHIWEN_CPROFILE=파일명     : cProfile 결과를 파일로 저장 (SHIWEN_PROFILE 없이도 계측 켜짐)
+#   SHIWEN_PROGRESS=초        : 계측 중 긴 반복문의 진행 상황을 그 간격(초)마다 stderr에 출력
+ENV_ENABLE = 'SHIWEN_PROFILE'
+ENV_OUTPUT = 'SHIWEN_PROFILE_OUT'
+ENV_CPROFILE = 'SHIWEN_CPROFILE'
+ENV_PROGRESS = 'SHIWEN_PROGRESS'
+
+_NULL_STAGE = contextlib.nullcontext()
+
+# 현재 실행 중인 계측 상태 (도구 하나당 한 번의 실행)
+_state = None
+
+def enabled():
+    """계측 기능이 켜져 있는지 확인"""
+    flag = os.environ.get(ENV_ENABLE, '').strip()
+    return flag not in ('', '0') or bool(os.environ.get(ENV_CPROFILE))
+
+def _windows_peak_rss_kb():
+    """Windows: GetProcessMemoryInfo의 PeakWorkingSetSize (바이트 -> KB)"""
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [('cb', wintypes.DWORD),
+                    ('PageFaultCount', wintypes.DWORD),
+                    ('PeakWorkingSetSize', ctypes.c_size_t),
+                    ('WorkingSetSize', ctypes.c_size_t),
+                    ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                    ('PagefileUsage', ctypes.c_size_t),
+                    ('PeakPagefileUsage', ctypes.c_size_t)]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    # GetCurrentProcess()는 의사 핸들(-1)을 반환하므로 restype을 HANDLE로 지정
+    kernel32 = ctypes.WinDLL('kernel32')
+    kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+    psapi = ctypes.WinDLL('psapi')
+    psapi.GetProcessMemoryInfo.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESS_MEMORY_COUNTERS), wintypes.DWORD]
+    if not psapi.GetProcessMemoryInfo(kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+        return None
+    return counters.PeakWorkingSetSize // 1024
+
+def peak_rss_kb():
+    """프로세스의 최대 메모리 사용량(RSS, KB). 확인할 수 없으면 None"""
+    if resource is None:
+        if sys.platform != 'win32':
+            return None
+        try:
+            return _windows_peak_rss_kb()
+        except Exception:
+            return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+def _progress_interval():
+    """SHIWEN_PROGRESS 값(초). 없거나 잘못된 값이면 None (진행 상황 출력 안 함)"""
+    try:
+        interval = float(os.environ.get(ENV_PROGRESS, ''))
+    except ValueError:
+        return None
+    return interval if interval > 0 else None
+
+def begin(tool):
+    """계측 시작. 꺼져 있으면 아무 일도 하지 않음"""
+    global _state
+    if not enabled():
+        _state = None
+        return
+
+    profiler = None
+    if os.environ.get(ENV_CPROFILE):
+        import cProfile
+        profiler = cProfile.Profile()
+
+    _state = {
+        'tool': tool,
+        'start': time.perf_counter(),
+        'stages': {},
+        'stack': [],
+        'counters': {},
+        'profiler': profiler,
+        'progress_interval': _progress_interval(),
+        'progress_last': time.perf_counter()
+    }
+
+    if profiler is not None:
+        profiler.enable()
+
+class _Stage:
+    """단계별 소요 시간을 누적하는 컨텍스트 매니저"""
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        _state['stack'].append(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        # 중간에 finish()가 호출된 경우(예: sys.exit)에는 기록하지 않음
+        if _state is None:
+            return False
+        _state['stack'].pop()
+        info = _state['stages'].setdefault(self.name, {'seconds': 0.0, 'calls': 0, 'items': 0})
+        info['seconds'] += elapsed
+        info['calls'] += 1
+        return False
+
+def stage(name):
+    """
+    단계(load, parse, match, write 등)의 소요 시간 측정
+    사용법: with instrument.stage('load'): ...
+    """
+    if _state is None:
+        return _NULL_STAGE
+    return _Stage(name)
+
+def count(name, n=1):
+    """
+    처리 항목 수 누적. 진행 중인 단계가 있으면 그 단계의 처리량(items/s)에도 반영
+    (전체 실행 시간에는 사용자 입력 대기가 포함되므로 처리량은 단계 안에서만 계산)
+    """
+    if _state is None:
+        return
+    _state['counters'][name] = _state['counters'].get(name, 0) + n
+    if _state['stack']:
+        info = _state['stages'].setdefault(_state['stack'][-1], {'seconds': 0.0, 'calls': 0, 'items': 0})
+        info['items'] += n
+
+def progress(name, done, total=None):
+    """
+    긴 반복문의 진행 상황을 SHIWEN_PROGRESS 간격(초)마다 stderr에 한 줄 출력
+    사용법: 반복문 안에서 instrument.progress('lines', i, 전체 수)
+    (계측이 꺼져 있거나 SHIWEN_PROGRESS가 없으면 아무 일도 하지 않음)
+    """
+    if _state is None or _state['progress_interval'] is None:
+        return
+    now = time.perf_counter()
+    if now - _state['progress_last'] < _state['progress_interval']:
+        return
+    _state['progress_last'] = now
+
+    done_text = f"{done}/{total} ({done / total:.1%})" if total else f"{done}"
+    print(f"[progress] {_state['tool']} {name} {done_text}, {now - _state['start']:.1f}s", file=sys.stderr)
+
+def summary():
+    """현재까지의 계측 결과를 dict로 반환"""
+    if _state is None:
+        return None
+
+    wall_time = time.perf_counter() - _state['start']
+    stages = {}
+    for name, info in _state['stages'].items():
+        item = {'seconds': round(info['seconds'], 4), 'calls': info['calls']}
+        if info['items']:
+            item['items'] = info['items']
+            item['items_per_sec'] = round(info['items'] / info['seconds'], 1) if info['seconds'] > 0 else None
+        stages[name] = item
+
+    return {
+        'tool': _state['tool'],
+        'wall_time': round(wall_time, 4),
+        'peak_rss_kb': peak_rss_kb(),
+        'stages': stages,
+        'counters': dict(_state['counters']),
+        'cprofile': os.environ.get(ENV_CPROFILE) or None
+    }
+
+def finish():
+    """계측 종료 후 요약(JSON 한 줄)을 출력하거나 파일에 추가"""
+    global _state
+    if _state is None:
+        return
+
+    profiler = _state['profiler']
+    if profiler is not None:
+        profiler.disable()
+
+    result = summary()
+    _state = None
+
+    if profiler is not None:
+        try:
+            profiler.dump_stats(result['cprofile'])
+        except Exception as e:
+            print(f"   [경고] cProfile 저장 실패: {e}", file=sys.stderr)
+
+    line = json.dumps(result, ensure_ascii=False, separators=(',', ':'))
+    out_path = os.environ.get(ENV_OUTPUT)
+    if out_path:
+        try:
+            with open(out_path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+            return
+        except Exception as e:
+            print(f"   [경고] 계측 결과 저장 실패: {e}", file=sys.stderr)
+    print(f"[profile] {line}", file=sys.stderr)
+
+@contextlib.contextmanager
+def run(tool):
+    """
+    도구 한 번의 실행 전체를 계측
+    사용법: with instrument.run('character_count'): main()
+    sys.exit()나 예외로 끝나도 요약은 출력됨
+    """
+    begin(tool)
+    try:
+        yield
+    finally:
+        finish()
@@ -0,0 +1,197 @@
+import re
+import os
+import sys
+import marshal
+import hashlib
+
+import instrument
+
+# 파싱 규칙이 바뀌면 올려서 기존 캐시를 무효화
+PARSER_VERSION = 2
+
+# 파싱 결과 디스크 캐시 (파일 내용의 해시로 찾으므로 같은 내용이면 경로가 달라도 재사용)
+# SHIWEN_CACHE_DIR 환경 변수로 위치 변경 가능, 오래 안 쓴 파일부터 지워 CACHE_MAX_FILES개 유지
+CACHE_DIR = os.environ.get('SHIWEN_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'shiwen_text')
+CACHE_MAX_FILES = 64
+
+# 디스크 캐시 앞단의 메모리 캐시
+# key: (절대 경로, 수정 시각, 크기) -> 파싱 결과. 오래된 것부터 지움
+MEMORY_CACHE_SIZE = 4
+_corpus_cache = {}
+
+# 줄 종류
+LINE_TEXT = 0   # 일반 행
+LINE_HEADER = 1 # '#'로 시작하는 행
+LINE_BLANK = 2  # 빈 행
+
+TAG_PATTERN = re.compile(r'<[^>]+>')
+ENTITY_PATTERN = re.compile(r'&KR\d+;')
+COMMENT_PATTERN = re.compile(r'\((.*?)\)')
+
+# &KR\d+; 문자열은 1개 글자로 간주하여 이 문자 하나로 치환 (글자 수 세기용, 원문 복원은 하지 않음)
+ENTITY_CHAR = '_'
+
+def content_hash(data):
+    """파일 내용(바이트)의 해시값 (캐시 키)"""
+    return hashlib.sha256(data).hexdigest()
+
+def decode_text(data):
+    """UTF-8로 읽고 개행 문자를 텍스트 모드 open()과 같이 '\\n'으로 통일"""
+    return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+def parse_text(text):
+    """
+    원문 전체를 파싱하여 구조화된 형태로 반환 (행 나누기는 readlines()와 같은 기준)
+    - kinds: 각 행의 종류 (LINE_TEXT / LINE_HEADER / LINE_BLANK)
+    - clean: 정리된 행 (태그, ¶, / 제거, 엔티티는 ENTITY_CHAR 1글자로 치환, 앞뒤 공백 제거)
+    - spans: clean 안에서 주석 '( )'의 (시작, 끝) 위치 목록 (괄호 포함)
+    - entities: 파일에 나온 엔티티 목록 (중복 없이 처음 나온 순서)
+    """
+    lines = text.split('\n')
+    # 파일이 개행으로 끝나면 마지막 빈 문자열은 행이 아님
+    if lines[-1] == '':
+        lines.pop()
+
+    entity_index = {}
+
+    def replace_entity(m):
+        entity_index.setdefault(m.group(0), len(entity_index))
+        return ENTITY_CHAR
+
+    kinds, clean, spans = [], [], []
+
+    for line in lines:
+        line = line.strip()
+
+        if not line:
+            kinds.append(LINE_BLANK)
+            clean.append('')
+            spans.append(())
+            continue
+
+        if line.startswith('#'):
+            kinds.append(LINE_HEADER)
+            clean.append('')
+            spans.append(())
+            continue
+
+        line = TAG_PATTERN.sub('', line)
+        line = line.replace('¶', '').replace('/', '')
+        line = ENTITY_PATTERN.sub(replace_entity, line)
+
+        kinds.append(LINE_TEXT)
+        clean.append(line)
+        spans.append(tuple((m.start(), m.end()) for m in COMMENT_PATTERN.finditer(line)))
+
+    return {
+        'kinds': kinds,
+        'clean': clean,
+        'spans': spans,
+        'entities': list(entity_index)
+    }
+
+def cache_path(digest):
+    """캐시 파일 경로 (파서 버전과 marshal 형식이 다른 Python 버전을 구분)"""
+    name = f"{digest}.v{PARSER_VERSION}.py{sys.version_info[0]}{sys.version_info[1]}.marshal"
+    return os.path.join(CACHE_DIR, name)
+
+def load_cache(path):
+    """캐시 파일을 불러옵니다. 없거나 깨져 있으면 None"""
+    try:
+        with open(path, 'rb') as f:
+            # marshal.load(f)는 파일을 조금씩 읽어 느리므로 한 번에 읽은 뒤 변환
+            parsed = marshal.loads(f.read())
+        # 최근 사용 시각 갱신 (정리할 때 오래 안 쓴 것부터 지움)
+        os.utime(path, None)
+        return parsed
+    except Exception:
+        return None
+
+def save_cache(path, parsed):
+    """파싱 결과를 캐시 파일로 저장합니다. 실패해도 작업은 계속 진행"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(marshal.dumps(parsed))
+        os.replace(tmp_path, path)
+        prune_cache()
+    except Exception as e:
+        print(f"   [경고] 캐시 저장 실패: {e}")
+
+def prune_cache():
+    """캐시 파일이 CACHE_MAX_FILES개를 넘으면 오래 안 쓴 것부터 지웁니다."""
+    entries = []
+    for name in os.listdir(CACHE_DIR):
+        if name.endswith('.marshal'):
+            path = os.path.join(CACHE_DIR, name)
+            entries.append((os.path.getmtime(path), path))
+    entries.sort()
+    for _, path in entries[:max(0, len(entries) - CACHE_MAX_FILES)]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def load_corpus(filepath, use_cache=True):
+    """
+    경전석문 텍스트 파일을 읽어 파싱 결과를 반환
+    같은 내용의 파일은 디스크 캐시(내용 해시 기준)에서 바로 불러오므로 다시 파싱하지 않음
+    실행 중에 같은 파일을 다시 부르면 메모리 캐시에서 바로 반환
+    """
+    stat = os.stat(filepath)
+    key = (os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size)
+    if use_cache and key in _corpus_cache:
+        return _corpus_cache[key]
+
+    with instrument.stage('load'):
+        with open(filepath, 'rb') as f:
+            data = f.read()
+
+        parsed = None
+        if use_cache:
+            path = cache_path(content_hash(data))
+            parsed = load_cache(path)
+
+    if parsed is None:
+        with instrument.stage('parse'):
+            parsed = parse_text(decode_text(data))
+            instrument.count('lines_parsed', len(parsed['kinds']))
+        if use_cache:
+            save_cache(path, parsed)
+
+    parsed['path'] = filepath
+    if use_cache:
+        _corpus_cache[key] = parsed
+        while len(_corpus_cache) > MEMORY_CACHE_SIZE:
+            del _corpus_cache[next(iter(_corpus_cache))]
+    return parsed
+
+def clear_cache(disk=False):
+    """메모리 캐시를 비웁니다. disk=True이면 디스크 캐시 파일도 지움"""
+    _corpus_cache.clear()
+    if disk and os.path.isdir(CACHE_DIR):
+        for name in os.listdir(CACHE_DIR):
+            if name.endswith('.marshal'):
+                try:
+                    os.remove(os.path.join(CACHE_DIR, name))
+                except OSError:
+                    pass
+
+# -------------------------------------------------------------------------
+# 파싱 결과 접근 함수
+# -------------------------------------------------------------------------
+def main_text(corpus, i):
+    """i번째 행의 경문 (주석 괄호와 그 내용을 제외한 부분)"""
+    line = corpus['clean'][i]
+    parts, pos = [], 0
+    for start, end in corpus['spans'][i]:
+        parts.append(line[pos:start])
+        pos = end
+    parts.append(line[pos:])
+    return "".join(parts)
+
+def comment_text(corpus, i):
+    """i번째 행의 주석 (여러 주석은 공백으로 이어 붙임)"""
+    line = corpus['clean'][i]
+    return " ".join(line[start + 1:end - 1] for start, end in corpus['spans'][i])
@@ -1,5 +1,10 @@
 import re
 import os
+import sys
+
+# 계측 모듈 (Common/instrument.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Common'))
+import instrument
 
 def run_regex_replacer():
     print("=== Regex 찾아 바꾸기 (확장 한자 지원) ===")
@@ -35,7 +40,9 @@ def run_regex_replacer():
         try:
             # re.subn은 (변경된 문자열, 변경된 횟수) 튜플을 반환합니다.
             # Python의 re.sub는 기본적으로 \1, \2 같은 역참조를 지원합니다.
-            new_content, count = re.subn(find_pattern, replace_pattern, content)
+            with instrument.stage('match'):
+                new_content, count = re.subn(find_pattern, replace_pattern, content)
+                instrument.count('replacements', count)
             
             if count > 0:
                 content = new_content
@@ -59,11 +66,12 @@ def run_regex_replacer():
 
     try:
         # 저장할 때도 utf-8을 사용하여 확장 한자를 보존합니다.
-        with open(output_filename, 'w', encoding='utf-8') as f:
+        with instrument.stage('write'), open(output_filename, 'w', encoding='utf-8') as f:
             f.write(content)
         print(f"[{output_filename}] 파일에 저장이 완료되었습니다.")
     except Exception as e:
         print(f"저장 중 오류가 발생했습니다: {e}")
 
 if __name__ == "__main__":
-    run_regex_replacer()
\ No newline at end of file
+    with instrument.run('replace'):
+        run_regex_replacer()
\ No newline at end of file